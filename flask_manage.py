@@ -9,10 +9,12 @@ LastModifiedDate : 2018-12-28 10:00:00
 Note : 拉起HTTP服务入口
 """
 
+import src.rpcs.services.ws_presence as ws_presence
 from src.restfuls.apps import create_app
 
 if __name__ == '__main__':
     _HOST = '0.0.0.0'
     _PORT = 5000
     flask_server = create_app()  # 实例化HTTP服务
+    ws_presence.get_presence()  # 启动Agent在线状态订阅
     flask_server.run(host=_HOST, port=_PORT, debug=False)